@@ -1,10 +1,12 @@
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
 from typing import Optional
 
 class Settings(BaseSettings):
     APP_NAME: str = "FastAPI Product Management API"
     VERSION: str = "1.0.0"
     API_V1_PREFIX: str = "/api/v1"
+    DEBUG: bool = False
+    RUN_DDL_ON_STARTUP: bool = False
 
     SECRET_KEY: str = "your-secret-key-change-this-in-production"
     ALGORITHM: str = "HS256"
@@ -19,11 +21,21 @@ class Settings(BaseSettings):
     POSTGRES_PORT: str = "5432"
     POSTGRES_DB: str
 
+    REDIS_URL: str = "redis://localhost:6379/0"
+
+    # Set when POSTGRES_HOST/POSTGRES_PORT point at PgBouncer in transaction mode
+    DB_USE_PGBOUNCER: bool = False
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: int = 30
+    DB_POOL_RECYCLE: int = 1800
+    # asyncpg / SQLAlchemy prepared statement caches per connection (unused behind PgBouncer)
+    DB_STATEMENT_CACHE_SIZE: int = 1024
+    DB_PREPARED_STATEMENT_CACHE_SIZE: int = 256
+
     CORS_ORIGINS: list = ["*"]
 
-    class Config:
-        env_file = ".env"
-        case_sensitive = True
+    model_config = SettingsConfigDict(env_file=".env", case_sensitive=True)
 
     @property
     def postgres_url(self) -> str:
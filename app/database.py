@@ -1,6 +1,10 @@
+import logging
+from uuid import uuid4
 from motor.motor_asyncio import AsyncIOMotorClient
+from redis.asyncio import Redis
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from sqlalchemy.orm import declarative_base
+from sqlalchemy.pool import NullPool
 from app.config import settings
 
 Base = declarative_base()
@@ -21,25 +25,72 @@ async def close_mongodb():
         mongodb.client.close()
         print("Closed MongoDB connection")
 
+class RedisClient:
+    client: Redis = None
+
+redis_client = RedisClient()
+
+async def connect_redis():
+    redis_client.client = Redis.from_url(settings.REDIS_URL, decode_responses=True)
+    print("Connected to Redis")
+
+async def close_redis():
+    if redis_client.client:
+        await redis_client.client.aclose()
+        print("Closed Redis connection")
+
+# Keep SQL logging quiet unless DEBUG explicitly turns echo on
+logging.getLogger("sqlalchemy.engine").setLevel(logging.WARNING)
+
+if settings.DB_USE_PGBOUNCER:
+    # PgBouncer (transaction mode) owns pooling across all workers, and
+    # server-side prepared statements can't outlive a single transaction
+    engine_options = dict(
+        poolclass=NullPool,
+        connect_args={
+            "statement_cache_size": 0,
+            "prepared_statement_cache_size": 0,
+            "prepared_statement_name_func": lambda: f"__asyncpg_{uuid4()}__",
+        }
+    )
+else:
+    engine_options = dict(
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        pool_pre_ping=True,
+        # Keep hot statements prepared server-side on each pooled connection
+        connect_args={
+            "statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+            "prepared_statement_cache_size": settings.DB_PREPARED_STATEMENT_CACHE_SIZE,
+        }
+    )
+
 engine = create_async_engine(
     settings.async_postgres_url,
-    echo=True,
-    future=True
+    echo=settings.DEBUG,
+    future=True,
+    **engine_options
 )
 
-print(settings.async_postgres_url)
 AsyncSessionLocal = async_sessionmaker(
     engine,
     class_=AsyncSession,
-    expire_on_commit=False
+    expire_on_commit=False,
+    autoflush=False
 )
 
+async def create_postgres_tables():
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
 async def get_postgres_db():
     async with AsyncSessionLocal() as session:
-        try:
-            yield session
-        finally:
-            await session.close()
+        yield session
 
 def get_mongodb():
     return mongodb.db
+
+def get_redis():
+    return redis_client.client
@@ -1,18 +1,82 @@
+import asyncio
+import time
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-from app.database import get_postgres_db
+from sqlalchemy import select, lambda_stmt
+from typing import NamedTuple, Optional
+from uuid import UUID
+from redis.asyncio import Redis
+from app.database import get_postgres_db, get_redis
 from app.models.user import User
-from app.utils.security import decode_access_token
+from app.utils.security import decode_access_token_payload
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login")
 
-active_tokens = set()
+TOKEN_CACHE_TTL_SECONDS = 60
+TOKEN_CACHE_MAXSIZE = 10_000
+
+class CachedUser(NamedTuple):
+    id: UUID
+    username: str
+    email: str
+    full_name: Optional[str]
+    is_active: bool
+    role_id: Optional[UUID]
+
+# token -> (expires_at, CachedUser). Only an immutable copy of the column
+# values is cached, never the ORM instance: that one belongs to the request
+# session and is expired by a rollback.
+_token_cache: dict = {}
+
+def _get_cached_user(token: str) -> Optional[User]:
+    entry = _token_cache.get(token)
+    if entry is None:
+        return None
+
+    expires_at, snapshot = entry
+    if expires_at <= time.time():
+        _token_cache.pop(token, None)
+        return None
+
+    # Fresh transient instance per request, not attached to any session
+    return User(**snapshot._asdict())
+
+def _cache_user(token: str, user: User, token_expires_at: float) -> None:
+    now = time.time()
+
+    if len(_token_cache) >= TOKEN_CACHE_MAXSIZE:
+        expired = [key for key, (expires_at, _) in _token_cache.items() if expires_at <= now]
+        for key in expired:
+            del _token_cache[key]
+        while len(_token_cache) >= TOKEN_CACHE_MAXSIZE:
+            _token_cache.pop(next(iter(_token_cache)))
+
+    snapshot = CachedUser(
+        id=user.id,
+        username=user.username,
+        email=user.email,
+        full_name=user.full_name,
+        is_active=user.is_active,
+        role_id=user.role_id
+    )
+    _token_cache[token] = (min(now + TOKEN_CACHE_TTL_SECONDS, token_expires_at), snapshot)
+
+def select_user_by_username(username: str):
+    # lambda_stmt caches the compiled SELECT; username is bound per call
+    return lambda_stmt(lambda: select(User).where(User.username == username))
+
+def token_key(token: str) -> str:
+    return f"tok:{token}"
+
+async def revoke_token(token: str, redis: Redis) -> None:
+    _token_cache.pop(token, None)
+    await redis.delete(token_key(token))
 
 async def get_current_user(
     token: str = Depends(oauth2_scheme),
-    db: AsyncSession = Depends(get_postgres_db)
+    db: AsyncSession = Depends(get_postgres_db),
+    redis: Redis = Depends(get_redis)
 ) -> User:
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
@@ -20,19 +84,37 @@ async def get_current_user(
         headers={"WWW-Authenticate": "Bearer"},
     )
 
-    if token not in active_tokens:
+    # Active tokens live in Redis so a logout on one worker revokes the
+    # token everywhere, even where the user is still cached locally
+    cached_user = _get_cached_user(token)
+    if cached_user is not None:
+        if not await redis.exists(token_key(token)):
+            _token_cache.pop(token, None)
+            raise credentials_exception
+        return cached_user
+
+    payload = decode_access_token_payload(token)
+    if payload is None:
         raise credentials_exception
 
-    username = decode_access_token(token)
+    username = payload.get("sub")
     if username is None:
         raise credentials_exception
 
-    result = await db.execute(select(User).where(User.username == username))
+    is_active_token, result = await asyncio.gather(
+        redis.exists(token_key(token)),
+        db.execute(select_user_by_username(username))
+    )
+    if not is_active_token:
+        raise credentials_exception
+
     user = result.scalar_one_or_none()
 
     if user is None:
         raise credentials_exception
 
+    _cache_user(token, user, payload.get("exp", 0))
+
     return user
 
 async def get_current_active_user(
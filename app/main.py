@@ -1,26 +1,30 @@
 from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from contextlib import asynccontextmanager
 from app.config import settings
-from app.database import connect_mongodb, close_mongodb, engine, Base
+from app.database import connect_mongodb, close_mongodb, connect_redis, close_redis, create_postgres_tables
 from app.routers import auth, categories, products, users, books, roles
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     await connect_mongodb()
+    await connect_redis()
 
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+    # Schema is managed by Alembic / app.scripts.init_db; opt in for local dev
+    if settings.RUN_DDL_ON_STARTUP:
+        await create_postgres_tables()
 
     yield
 
+    await close_redis()
     await close_mongodb()
 
 app = FastAPI(
     title=settings.APP_NAME,
     version=settings.VERSION,
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
     docs_url="/docs",
     redoc_url="/redoc"
 )
@@ -31,6 +35,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Total-Count", "X-Next-Cursor"],
 )
 
 @app.exception_handler(Exception)
@@ -0,0 +1,6 @@
+# Import every model so relationship() names like "Role" resolve no matter
+# which model module is imported first.
+from app.models.role import Role
+from app.models.user import User
+from app.models.category import Category
+from app.models.product import Product
@@ -19,5 +19,5 @@ class Category(Base):
 
     # 🔹 Relationship ke model User (pastikan kamu punya model User)
     creator = relationship("User", back_populates="category", lazy="selectin")
-    products = relationship("Product", back_populates="category", lazy="selectin")
+    products = relationship("Product", back_populates="category", lazy="raise_on_sql")
 
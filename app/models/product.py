@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey, Numeric, Integer
+from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey, Numeric, Integer, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.dialects.postgresql import UUID
 from datetime import datetime
@@ -7,6 +7,10 @@ from app.database import Base
 
 class Product(Base):
     __tablename__ = "products"
+    # 🔹 Keyset pagination per kategori: WHERE category_id = ? AND id > ? ORDER BY id
+    __table_args__ = (
+        Index("ix_products_category_id_id", "category_id", "id"),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     name = Column(String(50), unique=True, nullable=False)
@@ -14,4 +14,4 @@ class Role(Base):
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
-    users = relationship("User", back_populates="role")
+    users = relationship("User", back_populates="role", lazy="raise_on_sql")
@@ -19,6 +19,6 @@ class User(Base):
     
     role_id = Column(UUID(as_uuid=True), ForeignKey("roles.id"), nullable=True)
     
-    role = relationship("Role", back_populates="users")  
-    category = relationship("Category", back_populates="creator")
-    products = relationship("Product", back_populates="creator")
+    role = relationship("Role", back_populates="users", lazy="raise_on_sql")
+    category = relationship("Category", back_populates="creator", lazy="raise_on_sql")
+    products = relationship("Product", back_populates="creator", lazy="raise_on_sql")
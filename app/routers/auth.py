@@ -2,14 +2,15 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
+from redis.asyncio import Redis
 from datetime import timedelta
-from app.database import get_postgres_db
+from app.database import get_postgres_db, get_redis
 from app.models.user import User
 from app.schemas.auth import Token
 from app.schemas.user import UserCreate, UserResponse
-from app.utils.security import verify_password, get_password_hash, create_access_token
+from app.utils.security import verify_password_async, get_password_hash_async, create_access_token
 from app.config import settings
-from app.dependencies import active_tokens, oauth2_scheme
+from app.dependencies import oauth2_scheme, revoke_token, select_user_by_username, token_key
 
 router = APIRouter(prefix="/auth", tags=["Authentication"])
 
@@ -37,8 +38,7 @@ async def register(
                 detail="Username already taken"
             )
 
-    hashed_password = get_password_hash(user_data.password)
-    print(hashed_password)
+    hashed_password = await get_password_hash_async(user_data.password)
 
     new_user = User(
         email=user_data.email,
@@ -56,14 +56,13 @@ async def register(
 @router.post("/login", response_model=Token)
 async def login(
     form_data: OAuth2PasswordRequestForm = Depends(),
-    db: AsyncSession = Depends(get_postgres_db)
+    db: AsyncSession = Depends(get_postgres_db),
+    redis: Redis = Depends(get_redis)
 ):
-    result = await db.execute(
-        select(User).where(User.username == form_data.username)
-    )
+    result = await db.execute(select_user_by_username(form_data.username))
     user = result.scalar_one_or_none()
 
-    if not user or not verify_password(form_data.password, user.hashed_password):
+    if not user or not await verify_password_async(form_data.password, user.hashed_password):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect username or password",
@@ -81,13 +80,15 @@ async def login(
         data={"sub": user.username}, expires_delta=access_token_expires
     )
 
-    active_tokens.add(access_token)
+    await redis.setex(token_key(access_token), settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60, "1")
 
     return {"access_token": access_token, "token_type": "bearer", "metadata": {"email": user.email, "username": user.username, "full_name": user.full_name}}
 
 @router.post("/logout")
-async def logout(token: str = Depends(oauth2_scheme)):
-    if token in active_tokens:
-        active_tokens.remove(token)
+async def logout(
+    token: str = Depends(oauth2_scheme),
+    redis: Redis = Depends(get_redis)
+):
+    await revoke_token(token, redis)
 
     return {"message": "Successfully logged out"}
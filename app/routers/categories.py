@@ -43,8 +43,7 @@ async def get_category(
     db: AsyncSession = Depends(get_postgres_db),
     current_user: User = Depends(get_current_active_user)
 ):
-    result = await db.execute(select(Category).where(Category.id == category_id))
-    category = result.scalar_one_or_none()
+    category = await db.get(Category, category_id)
 
     print(category)
 
@@ -90,8 +89,7 @@ async def update_category(
     db: AsyncSession = Depends(get_postgres_db),
     current_user: User = Depends(get_current_active_user)
 ):
-    result = await db.execute(select(Category).where(Category.id == category_id))
-    category = result.scalar_one_or_none()
+    category = await db.get(Category, category_id)
 
     if not category:
         raise HTTPException(
@@ -128,8 +126,7 @@ async def delete_category(
     db: AsyncSession = Depends(get_postgres_db),
     current_user: User = Depends(get_current_active_user)
 ):
-    result = await db.execute(select(Category).where(Category.id == category_id))
-    category = result.scalar_one_or_none()
+    category = await db.get(Category, category_id)
 
     if not category:
         raise HTTPException(
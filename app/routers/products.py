@@ -1,47 +1,102 @@
+import asyncio
 from app.models.category import Category
 from app.models.product import Product
 from app.schemas.product import ProductCreate, ProductResponse, ProductUpdate
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
-from sqlalchemy.orm import selectinload
+from sqlalchemy import select, func, update, delete
+from sqlalchemy.orm import selectinload, load_only, raiseload
 from typing import List, Optional
 from app.database import get_postgres_db
 from app.models.user import User
 from app.dependencies import get_current_active_user
+from app.utils.http_cache import make_etag, not_modified_response
 from uuid import UUID
 
 router = APIRouter(prefix="/products", tags=["Products"])
 
+# Built once and shared by every product query. Loads only the columns
+# CategorySimple/UserSimple serialize.
+_PRODUCT_LOAD_OPTS = (
+    selectinload(Product.category).options(
+        load_only(Category.id, Category.name), raiseload("*")
+    ),
+    selectinload(Product.creator).options(
+        load_only(User.id, User.username), raiseload("*")
+    ),
+)
+
+async def count_products(db: AsyncSession, filters) -> int:
+    return await db.scalar(select(func.count()).select_from(Product).where(*filters))
+
+def product_etag_parts(product: Product) -> tuple:
+    # updated_at covers the product's own columns; the embedded names can
+    # change without touching the product row
+    return (product.id, product.updated_at, product.category.name, product.creator.username)
+
+
 # ======================================================
 # GET all products
 # ======================================================
 @router.get("", response_model=List[ProductResponse])
 async def get_all_products(
-    skip: int = Query(0, ge=0, description="Number of records to skip"),
+    request: Request,
+    response: Response,
+    skip: int = Query(0, ge=0, description="Number of records to skip (ignored when cursor is set)"),
     limit: int = Query(10, ge=1, le=100, description="Number of records to return"),
+    cursor: Optional[UUID] = Query(None, description="Return records after this product ID (from X-Next-Cursor)"),
     search: Optional[str] = Query(None, description="Search by name"),
     category_id: Optional[UUID] = Query(None, description="Filter by category ID"),
+    include_total: bool = Query(False, description="Return the total match count in the X-Total-Count header"),
     db: AsyncSession = Depends(get_postgres_db),
+    # Second, uncached session so the count can run alongside the page query
+    # (one AsyncSession can't run two statements at once). It only checks out
+    # a pooled connection when include_total is set.
+    count_db: AsyncSession = Depends(get_postgres_db, use_cache=False),
     current_user: User = Depends(get_current_active_user)
 ):
+    filters = []
+
+    if search:
+        filters.append(Product.name.ilike(f"%{search}%"))
+
+    if category_id:
+        filters.append(Product.category_id == category_id)
+
+    page_filters = list(filters)
+    if cursor:
+        page_filters.append(Product.id > cursor)
+
     query = (
         select(Product)
-        .options(
-            selectinload(Product.category),
-            selectinload(Product.creator),
-        )
+        .options(*_PRODUCT_LOAD_OPTS)
+        .where(*page_filters)
+        .order_by(Product.id)
+        .limit(limit)
     )
 
-    if search:
-        query = query.where((Product.name.ilike(f"%{search}%")))
-        
-    if category_id:
-        query = query.where(Product.category_id == category_id)
+    # Keyset pagination stays O(limit) at any depth; offset is kept for
+    # existing clients
+    if not cursor:
+        query = query.offset(skip)
+
+    total = None
+    if include_total:
+        result, total = await asyncio.gather(db.execute(query), count_products(count_db, filters))
+        response.headers["X-Total-Count"] = str(total)
+    else:
+        result = await db.execute(query)
 
-    query = query.offset(skip).limit(limit)
-    result = await db.execute(query)
-    products = result.scalars().unique().all()
+    # selectinload never duplicates parent rows, so no .unique() pass needed
+    products = result.scalars().all()
+
+    if len(products) == limit:
+        response.headers["X-Next-Cursor"] = str(products[-1].id)
+
+    etag = make_etag(total, *(part for product in products for part in product_etag_parts(product)))
+    not_modified = not_modified_response(request, response, etag)
+    if not_modified:
+        return not_modified
 
     return products
 
@@ -51,21 +106,13 @@ async def get_all_products(
 # ======================================================
 @router.get("/{product_id}", response_model=ProductResponse)
 async def get_product(
+    request: Request,
+    response: Response,
     product_id: UUID,
     db: AsyncSession = Depends(get_postgres_db),
     current_user: User = Depends(get_current_active_user)
 ):
-    result = await db.execute(
-        select(Product)
-        .options(
-            selectinload(Product.category),
-            selectinload(Product.creator),
-        )
-        .where(Product.id == product_id)
-    )
-    product = result.scalar_one_or_none()
-
-    # print(product)
+    product = await db.get(Product, product_id, options=_PRODUCT_LOAD_OPTS)
 
     if not product:
         raise HTTPException(
@@ -73,6 +120,10 @@ async def get_product(
             detail="Product not found"
         )
 
+    not_modified = not_modified_response(request, response, make_etag(*product_etag_parts(product)))
+    if not_modified:
+        return not_modified
+
     return product
 
 
@@ -121,26 +172,32 @@ async def update_product(
     db: AsyncSession = Depends(get_postgres_db),
     current_user: User = Depends(get_current_active_user)
 ):
-    result = await db.execute(select(Product).where(Product.id == product_id))
-    product = result.scalar_one_or_none()
+    # ✅ Update only provided fields
+    update_fields = product_data.model_dump(exclude_unset=True)
+
+    # ✅ Authorization optional: only owner or admin can update
+    # add Product.created_by == current_user.id to the WHERE below (unless admin)
+
+    if update_fields:
+        # UPDATE ... RETURNING: one round-trip, no SELECT beforehand
+        result = await db.execute(
+            update(Product)
+            .where(Product.id == product_id)
+            .values(**update_fields)
+            .returning(Product)
+            .options(*_PRODUCT_LOAD_OPTS)
+        )
+        product = result.scalar_one_or_none()
+    else:
+        product = await db.get(Product, product_id, options=_PRODUCT_LOAD_OPTS)
 
     if not product:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Product not found"
         )
-        
-    # ✅ Authorization optional: only owner or admin can update
-    # if product.created_by != current_user.id and not current_user.is_admin:
-    #     raise HTTPException(status_code=403, detail="Not authorized to update this product")
-
-    # ✅ Update only provided fields
-    update_fields = product_data.dict(exclude_unset=True)
-    for key, value in update_fields.items():
-        setattr(product, key, value)
 
     await db.commit()
-    await db.refresh(product)
 
     return product
 
@@ -154,20 +211,19 @@ async def delete_category(
     db: AsyncSession = Depends(get_postgres_db),
     current_user: User = Depends(get_current_active_user)
 ):
-    result = await db.execute(select(Product).where(Product.id == product_id))
-    product = result.scalar_one_or_none()
+    # ✅ Optional: only owner or admin can delete
+    # add Product.created_by == current_user.id to the WHERE below (unless admin)
 
-    if not product:
+    result = await db.execute(
+        delete(Product).where(Product.id == product_id).returning(Product.id)
+    )
+
+    if result.scalar_one_or_none() is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Product not found"
         )
-        
-    # ✅ Optional: only owner or admin can delete
-    # if product.created_by != current_user.id and not current_user.is_admin:
-    #     raise HTTPException(status_code=403, detail="Not authorized to delete this product")
 
-    await db.delete(product)
     await db.commit()
 
     return None
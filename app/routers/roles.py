@@ -2,6 +2,7 @@ from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func
 from typing import List
+from uuid import UUID
 from app.database import get_postgres_db
 from app.models.role import Role
 from app.models.user import User
@@ -34,12 +35,11 @@ async def get_all_roles(
 
 @router.get("/{role_id}", response_model=RoleResponse)
 async def get_role(
-    role_id: str,
+    role_id: UUID,
     db: AsyncSession = Depends(get_postgres_db),
     current_user: User = Depends(get_current_active_user)
 ):
-    result = await db.execute(select(Role).where(Role.id == role_id))
-    role = result.scalar_one_or_none()
+    role = await db.get(Role, role_id)
     
     print(role)
 
@@ -85,13 +85,12 @@ async def create_role(
 
 @router.put("/{role_id}", response_model=RoleResponse)
 async def update_role(
-    role_id: str,
+    role_id: UUID,
     role_data: RoleUpdate,
     db: AsyncSession = Depends(get_postgres_db),
     current_user: User = Depends(get_current_active_user)
 ):
-    result = await db.execute(select(Role).where(Role.id == role_id))
-    role = result.scalar_one_or_none()
+    role = await db.get(Role, role_id)
 
     if not role:
         raise HTTPException(
@@ -123,12 +122,11 @@ async def update_role(
 
 @router.delete("/{role_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_role(
-    role_id: str,
+    role_id: UUID,
     db: AsyncSession = Depends(get_postgres_db),
     current_user: User = Depends(get_current_active_user)
 ):
-    result = await db.execute(select(Role).where(Role.id == role_id))
-    role = result.scalar_one_or_none()
+    role = await db.get(Role, role_id)
 
     if not role:
         raise HTTPException(
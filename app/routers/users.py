@@ -1,13 +1,15 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
+from sqlalchemy import select, func, or_, delete
+from sqlalchemy.dialects.postgresql import insert
 from typing import List
+from uuid import UUID
 from app.database import get_postgres_db
 from app.models.user import User
 from app.models.role import Role
 from app.schemas.user import UserResponse, UserCreate, UserUpdate
 from app.dependencies import get_current_active_user
-from app.utils.security import get_password_hash
+from app.utils.security import get_password_hash_async
 
 router = APIRouter(prefix="/users", tags=["Users"])
 
@@ -35,12 +37,11 @@ async def get_all_users(
 
 @router.get("/{user_id}", response_model=UserResponse)
 async def get_user(
-    user_id: str,
+    user_id: UUID,
     db: AsyncSession = Depends(get_postgres_db),
     current_user: User = Depends(get_current_active_user)
 ):
-    result = await db.execute(select(User).where(User.id == user_id))
-    user = result.scalar_one_or_none()
+    user = await db.get(User, user_id)
 
     if not user:
         raise HTTPException(
@@ -56,53 +57,51 @@ async def create_user(
     db: AsyncSession = Depends(get_postgres_db),
     current_user: User = Depends(get_current_active_user)
 ):
+    # Hashed up front so the insert stays a single statement; a duplicate
+    # POST therefore still pays for one (off-loop) bcrypt hash
+    hashed_password = await get_password_hash_async(user_data.password)
+
+    # Duplicate check, admin role lookup and insert in one round-trip: a
+    # unique conflict on email or username inserts nothing and returns no row
     result = await db.execute(
-        select(User).where(
-            (User.email == user_data.email) | (User.username == user_data.username)
+        insert(User)
+        .values(
+            email=user_data.email,
+            username=user_data.username,
+            full_name=user_data.full_name,
+            hashed_password=hashed_password,
+            role_id=select(Role.id).where(Role.name == "admin").scalar_subquery()
         )
+        .on_conflict_do_nothing()
+        .returning(User)
     )
-    existing_user = result.scalar_one_or_none()
+    new_user = result.scalar_one_or_none()
 
-    if existing_user:
+    if not new_user:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Email or username already registered"
         )
 
-    hashed_password = get_password_hash(user_data.password)
-    
-    role_result = await db.execute(select(Role).where(Role.name == "admin"))
-    admin_role = role_result.scalar_one_or_none()
-    
-    if not admin_role:
+    if new_user.role_id is None:
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Default role 'admin' not found"
         )
 
-    new_user = User(
-        email=user_data.email,
-        username=user_data.username,
-        full_name=user_data.full_name,
-        hashed_password=hashed_password,
-        role_id=admin_role.id   
-    )
-
-    db.add(new_user)
     await db.commit()
-    await db.refresh(new_user)
 
     return new_user
 
 @router.put("/{user_id}", response_model=UserResponse)
 async def update_user(
-    user_id: str,
+    user_id: UUID,
     user_data: UserUpdate,
     db: AsyncSession = Depends(get_postgres_db),
     current_user: User = Depends(get_current_active_user)
 ):
-    result = await db.execute(select(User).where(User.id == user_id))
-    user = result.scalar_one_or_none()
+    user = await db.get(User, user_id)
 
     if not user:
         raise HTTPException(
@@ -110,33 +109,41 @@ async def update_user(
             detail="User not found"
         )
 
+    # Check email and username uniqueness in a single query
+    conditions = []
     if user_data.email is not None:
+        conditions.append(User.email == user_data.email)
+    if user_data.username is not None:
+        conditions.append(User.username == user_data.username)
+
+    if conditions:
         existing = await db.execute(
-            select(User).where(User.email == user_data.email, User.id != user_id)
+            select(User.email, User.username).where(User.id != user_id, or_(*conditions))
         )
-        if existing.scalar_one_or_none():
+        rows = existing.all()
+
+        if user_data.email is not None and any(row.email == user_data.email for row in rows):
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Email already registered"
             )
-        user.email = user_data.email
-
-    if user_data.username is not None:
-        existing = await db.execute(
-            select(User).where(User.username == user_data.username, User.id != user_id)
-        )
-        if existing.scalar_one_or_none():
+        if user_data.username is not None and any(row.username == user_data.username for row in rows):
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Username already taken"
             )
+
+    if user_data.email is not None:
+        user.email = user_data.email
+
+    if user_data.username is not None:
         user.username = user_data.username
 
     if user_data.full_name is not None:
         user.full_name = user_data.full_name
 
     if user_data.password is not None:
-        user.hashed_password = get_password_hash(user_data.password)
+        user.hashed_password = await get_password_hash_async(user_data.password)
 
     if user_data.is_active is not None:
         user.is_active = user_data.is_active
@@ -151,20 +158,20 @@ async def update_user(
 
 @router.delete("/{user_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_user(
-    user_id: str,
+    user_id: UUID,
     db: AsyncSession = Depends(get_postgres_db),
     current_user: User = Depends(get_current_active_user)
 ):
-    result = await db.execute(select(User).where(User.id == user_id))
-    user = result.scalar_one_or_none()
+    result = await db.execute(
+        delete(User).where(User.id == user_id).returning(User.id)
+    )
 
-    if not user:
+    if result.scalar_one_or_none() is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="User not found"
         )
 
-    await db.delete(user)
     await db.commit()
 
     return None
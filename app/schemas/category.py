@@ -1,5 +1,5 @@
 from app.schemas.user import UserSimple
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional
 from datetime import datetime
 import uuid
@@ -21,13 +21,11 @@ class CategoryResponse(CategoryBase):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, extra="forbid")
 
 
 class CategorySimple(BaseModel):
     id: uuid.UUID
     name: str
 
-    class Config:
-        from_attributes = True
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True, extra="forbid")
\ No newline at end of file
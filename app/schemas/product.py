@@ -1,6 +1,6 @@
 from app.schemas.category import CategorySimple
 from app.schemas.user import UserSimple
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional
 from datetime import datetime
 import uuid
@@ -37,5 +37,4 @@ class ProductResponse(ProductBase):
     updated_at: datetime
     category: Optional[CategorySimple] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, extra="forbid")
@@ -1,5 +1,5 @@
 # from sqlalchemy import Column, String, Boolean, Integer, DateTime, ForeignKey
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import BaseModel, ConfigDict, EmailStr, Field
 from typing import Optional
 from datetime import datetime
 import uuid
@@ -30,8 +30,7 @@ class UserResponse(UserBase):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, extra="forbid")
 
 class UserLogin(BaseModel):
     username: str
@@ -41,5 +40,4 @@ class UserSimple(BaseModel):
     id: uuid.UUID
     username: str
 
-    class Config:
-        from_attributes = True
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True, extra="forbid")
\ No newline at end of file
@@ -0,0 +1,12 @@
+import asyncio
+from app.database import engine, create_postgres_tables
+# Register every model on Base.metadata before create_all
+from app.models import category, product, role, user
+
+async def init_db():
+    await create_postgres_tables()
+    await engine.dispose()
+    print("PostgreSQL tables created")
+
+if __name__ == "__main__":
+    asyncio.run(init_db())
@@ -0,0 +1,24 @@
+import hashlib
+from typing import Optional
+from fastapi import Request, Response, status
+
+# Authenticated responses: browser may reuse them briefly, shared caches may not
+CACHE_CONTROL = "private, max-age=5"
+
+def make_etag(*parts) -> str:
+    digest = hashlib.md5("|".join(str(part) for part in parts).encode()).hexdigest()
+    return f'W/"{digest}"'
+
+def not_modified_response(request: Request, response: Response, etag: str) -> Optional[Response]:
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = CACHE_CONTROL
+
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return None
+
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    if etag not in candidates and "*" not in candidates:
+        return None
+
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=dict(response.headers))
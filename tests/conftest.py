@@ -0,0 +1,123 @@
+import asyncio
+import os
+
+os.environ.setdefault("MONGODB_URL", "mongodb://localhost:27017")
+os.environ.setdefault("POSTGRES_USER", "test")
+os.environ.setdefault("POSTGRES_PASSWORD", "test")
+os.environ.setdefault("POSTGRES_HOST", "localhost")
+os.environ.setdefault("POSTGRES_DB", "test")
+
+import pytest
+from datetime import timedelta
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.pool import NullPool
+
+from app.database import Base, get_postgres_db, get_redis
+from app.dependencies import _token_cache, token_key
+from app.main import app
+from app.models.category import Category
+from app.models.product import Product
+from app.models.role import Role
+from app.models.user import User
+from app.utils.security import create_access_token
+
+# SQLite has no native UUID type; store them the way the generic Uuid type does
+@compiles(UUID, "sqlite")
+def compile_uuid_sqlite(type_, compiler, **kw):
+    return "CHAR(32)"
+
+class FakeRedis:
+    def __init__(self):
+        self.store = {}
+
+    async def setex(self, key, seconds, value):
+        self.store[key] = value
+
+    async def exists(self, key):
+        return int(key in self.store)
+
+    async def delete(self, key):
+        return int(self.store.pop(key, None) is not None)
+
+@pytest.fixture
+def engine(tmp_path):
+    # File-backed + NullPool: TestClient runs each request on its own event loop
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path}/test.db", poolclass=NullPool)
+
+    async def create_tables():
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+
+    asyncio.run(create_tables())
+    yield engine
+    asyncio.run(engine.dispose())
+
+@pytest.fixture
+def session_factory(engine):
+    return async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False, autoflush=False)
+
+@pytest.fixture
+def statements(engine):
+    executed = []
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def count(conn, cursor, statement, parameters, context, executemany):
+        executed.append(statement)
+
+    return executed
+
+@pytest.fixture
+def seed(session_factory):
+    async def create_rows():
+        async with session_factory() as session:
+            role = Role(name="admin")
+            session.add(role)
+            await session.flush()
+
+            user = User(email="alice@example.com", username="alice", hashed_password="x", role_id=role.id)
+            session.add(user)
+            await session.flush()
+
+            categories = [Category(name=f"category-{i}", created_by=user.id) for i in range(3)]
+            session.add_all(categories)
+            await session.flush()
+
+            session.add_all([
+                Product(name=f"product-{i}", price=1, stock=1, low_stock_threshold=1,
+                        category_id=categories[i % 3].id, created_by=user.id)
+                for i in range(30)
+            ])
+            await session.commit()
+            return {"user_id": user.id, "role_id": role.id, "category_id": categories[0].id}
+
+    return asyncio.run(create_rows())
+
+@pytest.fixture
+def redis():
+    return FakeRedis()
+
+@pytest.fixture
+def client(session_factory, redis, seed):
+    async def override_get_postgres_db():
+        async with session_factory() as session:
+            yield session
+
+    app.dependency_overrides[get_postgres_db] = override_get_postgres_db
+    app.dependency_overrides[get_redis] = lambda: redis
+    _token_cache.clear()
+
+    # No `with`: lifespan would try to reach MongoDB and Redis
+    yield TestClient(app, raise_server_exceptions=False)
+
+    app.dependency_overrides.clear()
+    _token_cache.clear()
+
+@pytest.fixture
+def auth_headers(redis):
+    token = create_access_token({"sub": "alice"}, expires_delta=timedelta(minutes=5))
+    redis.store[token_key(token)] = "1"
+    return {"Authorization": f"Bearer {token}"}
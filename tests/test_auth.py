@@ -0,0 +1,23 @@
+def test_cached_user_survives_rollback_in_the_request_that_cached_it(client, auth_headers):
+    # Cache miss: the user is loaded in this request's session, whose commit
+    # then fails on the duplicate category name and rolls back
+    response = client.post("/api/v1/categories", json={"name": "category-0"}, headers=auth_headers)
+    assert response.status_code == 500
+
+    response = client.get("/api/v1/categories", headers=auth_headers)
+    assert response.status_code == 200
+
+def test_cached_user_is_not_touched_by_request_mutations(client, auth_headers, seed):
+    assert client.get("/api/v1/users", headers=auth_headers).status_code == 200
+
+    response = client.put(f"/api/v1/users/{seed['user_id']}", json={"full_name": "Alice A."}, headers=auth_headers)
+    assert response.status_code == 200
+
+    response = client.get(f"/api/v1/users/{seed['user_id']}", headers=auth_headers)
+    assert response.json()["full_name"] == "Alice A."
+
+def test_logout_revokes_cached_token(client, auth_headers):
+    assert client.get("/api/v1/categories", headers=auth_headers).status_code == 200
+    assert client.post("/api/v1/auth/logout", headers=auth_headers).status_code == 200
+
+    assert client.get("/api/v1/categories", headers=auth_headers).status_code == 401
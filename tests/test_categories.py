@@ -0,0 +1,11 @@
+def test_get_category_does_not_load_products(client, auth_headers, seed, statements):
+    assert client.get("/api/v1/categories", headers=auth_headers).status_code == 200
+    statements.clear()
+
+    response = client.get(f"/api/v1/categories/{seed['category_id']}", headers=auth_headers)
+
+    assert response.status_code == 200
+    assert response.json()["creator"]["username"] == "alice"
+    # categories + selectin creator; Category.products is raise_on_sql
+    assert len(statements) == 2
+    assert not any("FROM products" in statement for statement in statements)
@@ -0,0 +1,38 @@
+def test_list_products_emits_one_query_per_table(client, auth_headers, statements):
+    # Warm the token cache so only the route's own queries are counted
+    assert client.get("/api/v1/products", headers=auth_headers).status_code == 200
+    statements.clear()
+
+    response = client.get("/api/v1/products?limit=100", headers=auth_headers)
+
+    assert response.status_code == 200
+    assert len(response.json()) == 30
+    # products, categories(id, name), users(id, username) - no N+1, no
+    # Category.creator / Category.products fan-out
+    assert len(statements) == 3
+    assert "hashed_password" not in " ".join(statements)
+
+def test_list_products_serializes_embedded_category_and_creator(client, auth_headers):
+    product = client.get("/api/v1/products?limit=1", headers=auth_headers).json()[0]
+
+    assert product["category"]["name"].startswith("category-")
+    assert product["creator"]["username"] == "alice"
+
+def test_list_products_include_total_counts_all_matches(client, auth_headers, seed):
+    response = client.get(
+        f"/api/v1/products?limit=2&include_total=true&category_id={seed['category_id']}",
+        headers=auth_headers
+    )
+
+    assert response.status_code == 200
+    assert len(response.json()) == 2
+    assert response.headers["X-Total-Count"] == "10"
+
+def test_list_products_skips_count_without_include_total(client, auth_headers, statements):
+    assert client.get("/api/v1/products", headers=auth_headers).status_code == 200
+    statements.clear()
+
+    response = client.get("/api/v1/products", headers=auth_headers)
+
+    assert "X-Total-Count" not in response.headers
+    assert not any("count(" in statement.lower() for statement in statements)
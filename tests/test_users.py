@@ -0,0 +1,38 @@
+import asyncio
+from sqlalchemy import func, select, update
+from app.models.role import Role
+from app.models.user import User
+
+NEW_USER = {"email": "bob@example.com", "username": "bob", "password": "secret123"}
+
+def test_create_user_assigns_admin_role(client, auth_headers, seed):
+    response = client.post("/api/v1/users", json=NEW_USER, headers=auth_headers)
+
+    assert response.status_code == 201
+    assert response.json()["role_id"] == str(seed["role_id"])
+
+def test_create_user_rejects_duplicate(client, auth_headers):
+    duplicate = {**NEW_USER, "username": "alice"}
+
+    response = client.post("/api/v1/users", json=duplicate, headers=auth_headers)
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Email or username already registered"
+
+def test_create_user_without_admin_role_inserts_nothing(client, auth_headers, session_factory):
+    async def rename_admin_role():
+        async with session_factory() as session:
+            await session.execute(update(Role).values(name="staff"))
+            await session.commit()
+
+    async def count_users():
+        async with session_factory() as session:
+            return await session.scalar(select(func.count()).select_from(User))
+
+    asyncio.run(rename_admin_role())
+
+    response = client.post("/api/v1/users", json=NEW_USER, headers=auth_headers)
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Default role 'admin' not found"
+    assert asyncio.run(count_users()) == 1